@@ -92,7 +92,8 @@ class OllamaNativeAgent:
                     "tool_calls": tool_calls
                 })
                 
-                # Execute each tool call
+                # Collect each tool call
+                calls = []
                 for tool_call in tool_calls:
                     function = tool_call.get('function', {})
                     tool_name = function.get('name')
@@ -106,10 +107,11 @@ class OllamaNativeAgent:
                             logger.error(f"Failed to parse tool arguments: {tool_args}")
                             tool_args = {}
                     
-                    # Execute the tool
                     logger.info(f"Executing tool: {tool_name} with args: {tool_args}")
-                    result = self.tool_registry.execute_tool(tool_name, tool_args)
-                    
+                    calls.append((tool_name, tool_args))
+                
+                # Execute the independent tool calls concurrently
+                for result in self.tool_registry.execute_tools_batch(calls):
                     # Add tool result to conversation
                     self.conversation_history.append({
                         "role": "tool",
@@ -386,20 +388,18 @@ class OllamaOpenAICompatible:
                     ]
                 })
                 
-                # Execute tool calls
+                # Parse arguments of each tool call
+                calls = []
                 for tool_call in assistant_message.tool_calls:
-                    # Parse arguments
                     try:
                         args = json.loads(tool_call.function.arguments)
                     except json.JSONDecodeError:
                         args = {}
-                    
-                    # Execute tool
-                    result = self.tool_registry.execute_tool(
-                        tool_call.function.name,
-                        args
-                    )
-                    
+                    calls.append((tool_call.function.name, args))
+                
+                # Execute the independent tool calls concurrently
+                results = self.tool_registry.execute_tools_batch(calls)
+                for tool_call, result in zip(assistant_message.tool_calls, results):
                     # Add tool result
                     self.conversation_history.append({
                         "role": "tool",
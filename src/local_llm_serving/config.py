@@ -2,25 +2,57 @@
 Configuration for Ollama Tool Calling Demo
 """
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Model Configuration
-MODEL_NAME = os.getenv("MODEL_NAME", "qwen3:0.6b")  # Default Ollama model
-MODEL_PATH = os.getenv("MODEL_PATH", None)  # Optional: local model path
 
-# Ollama Configuration
-OLLAMA_HOST = os.getenv("OLLAMA_HOST", "localhost")
-OLLAMA_PORT = int(os.getenv("OLLAMA_PORT", 11434))
+def _env_int(name: str, default: int) -> int:
+    """Read an integer environment variable, naming the variable on bad input"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"Environment variable {name} must be an integer, got {value!r}") from None
 
-# Tool Configuration
-ENABLE_WEATHER_TOOL = True
-ENABLE_CALCULATOR_TOOL = True
-ENABLE_SEARCH_TOOL = True
 
-# Logging
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-LOG_FILE = Path("logs") / "ollama_tool_demo.log"
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Immutable application settings, read from the environment once at import"""
+
+    # Model Configuration
+    model_name: str = field(default_factory=lambda: os.getenv("MODEL_NAME", "qwen3:0.6b"))  # Default Ollama model
+    model_path: Optional[str] = field(default_factory=lambda: os.getenv("MODEL_PATH"))  # Optional: local model path
+
+    # Ollama Configuration
+    ollama_host: str = field(default_factory=lambda: os.getenv("OLLAMA_HOST", "localhost"))
+    ollama_port: int = field(default_factory=lambda: _env_int("OLLAMA_PORT", 11434))
+
+    # Tool Configuration
+    enable_weather_tool: bool = True
+    enable_calculator_tool: bool = True
+    enable_search_tool: bool = True
+
+    # Logging
+    log_level: str = field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
+    log_file: Path = Path("logs") / "ollama_tool_demo.log"
+
+
+CONFIG = Config()
+
+# Module-level names kept for backward compatibility; prefer CONFIG
+MODEL_NAME = CONFIG.model_name
+MODEL_PATH = CONFIG.model_path
+OLLAMA_HOST = CONFIG.ollama_host
+OLLAMA_PORT = CONFIG.ollama_port
+ENABLE_WEATHER_TOOL = CONFIG.enable_weather_tool
+ENABLE_CALCULATOR_TOOL = CONFIG.enable_calculator_tool
+ENABLE_SEARCH_TOOL = CONFIG.enable_search_tool
+LOG_LEVEL = CONFIG.log_level
+LOG_FILE = CONFIG.log_file
@@ -1,17 +1,134 @@
 """
 Tool implementations for the local LLM serving package
 """
+import ast
+import copy
+import hashlib
+import importlib
 import json
 import math
+import os
 import random
-import io
-import contextlib
-from typing import Dict, Any, List
-from datetime import datetime
-import requests
-from io import BytesIO
-import PyPDF2
+import re
 import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone as dt_timezone, tzinfo
+from types import CodeType, MappingProxyType, ModuleType
+from typing import BinaryIO, Dict, Any, List, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# Markdown code fences around code_interpreter input, e.g. ```python ... ```
+_CODE_FENCE = re.compile(r'^```(?:python|py)?\s*\n|\n```\s*$|^```\s*|\s*```$')
+
+# Globals every code_interpreter run starts from; copied per call.
+# Includes all builtins, giving the agent the complete Python environment.
+_BASE_NAMESPACE = {
+    '__builtins__': __builtins__,
+    'math': math,
+    'sqrt': math.sqrt,  # Make sqrt directly available
+    'random': random,
+    'datetime': datetime,
+    'sys': sys,
+    're': re,
+    'json': json
+}
+
+# Results of successful code_interpreter runs keyed by a hash of the cleaned code
+_EXEC_CACHE_SIZE = 256
+_exec_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_exec_cache_lock = threading.Lock()
+
+# Compiled code objects and their result cacheability, keyed like _exec_cache,
+# so code that cannot be result-cached still skips parse and compile on repeats
+_CODE_CACHE_SIZE = 512
+_code_cache: "OrderedDict[str, Tuple[CodeType, bool]]" = OrderedDict()
+_code_cache_lock = threading.Lock()
+
+# code_interpreter always runs in a child process with these limits. The child
+# is forked where that is safe and spawned elsewhere (Windows, and macOS where
+# system libraries make fork unreliable)
+_EXEC_START_METHOD = "fork" if sys.platform != "darwin" and hasattr(os, "fork") else "spawn"
+_EXEC_TIMEOUT = 10  # seconds of wall time
+_EXEC_CPU_LIMIT = 5  # seconds of CPU time
+_EXEC_MEMORY_LIMIT = 1024 * 1024 * 1024  # bytes of address space beyond the child's start
+_EXEC_EXIT_GRACE = 1  # seconds a child may take to exit before it is killed
+
+# Results are only cached for code whose imports and module attribute roots
+# are all in this set of pure, deterministic standard library modules
+_PURE_MODULES = frozenset({
+    "math", "cmath", "json", "re", "statistics", "fractions", "itertools",
+    "functools", "operator", "collections", "string", "heapq", "bisect"
+})
+
+# Marker for module attribute chains that leave the pure modules
+_UNSAFE = object()
+
+# Builtins and namespace entries that perform I/O, are non-deterministic or
+# reach outside the code; any name or attribute matching these disables caching
+_UNCACHEABLE_NAMES = frozenset({
+    "random", "datetime", "sys", "open", "input", "id", "eval", "exec",
+    "compile", "__import__", "__builtins__", "getattr", "setattr", "delattr",
+    "globals", "locals", "vars", "breakpoint", "exit", "quit", "help"
+})
+
+# Common timezone abbreviations are mapped to fixed UTC offsets; other names
+# are looked up as IANA zones
+_TIMEZONE_OFFSETS = {
+    "UTC": 0,
+    "EST": -5, "EDT": -4,
+    "CST": -6, "CDT": -5,
+    "MST": -7, "MDT": -6,
+    "PST": -8, "PDT": -7,
+    "GMT": 0,
+    "CET": 1, "CEST": 2,
+    "JST": 9,
+    "AEST": 10, "AEDT": 11
+}
+_TIMEZONES = MappingProxyType({
+    name: dt_timezone(timedelta(hours=offset), name)
+    for name, offset in _TIMEZONE_OFFSETS.items()
+})
+
+# IANA zones resolved through zoneinfo, memoized by name
+_zone_cache: Dict[str, tzinfo] = {}
+
+# Private generator for get_random_number, independent of the global random state
+_rng = random.Random()
+_MAX_RANDOM_COUNT = 1000
+
+# Mock exchange rates for demonstration
+_EXCHANGE_RATES = {
+    "USD": {"EUR": 0.85, "GBP": 0.73, "JPY": 110.0, "CAD": 1.25, "AUD": 1.35},
+    "EUR": {"USD": 1.18, "GBP": 0.86, "JPY": 129.0, "CAD": 1.47, "AUD": 1.59},
+    "GBP": {"USD": 1.37, "EUR": 1.16, "JPY": 150.0, "CAD": 1.71, "AUD": 1.85},
+    "JPY": {"USD": 0.0091, "EUR": 0.0078, "GBP": 0.0067, "CAD": 0.011, "AUD": 0.012},
+    "CAD": {"USD": 0.80, "EUR": 0.68, "GBP": 0.58, "JPY": 88.0, "AUD": 1.08},
+    "AUD": {"USD": 0.74, "EUR": 0.63, "GBP": 0.54, "JPY": 81.0, "CAD": 0.93}
+}
+
+# Flattened (from, to) -> rate table for single-lookup conversion
+_RATES = {
+    (from_code, to_code): rate
+    for from_code, row in _EXCHANGE_RATES.items()
+    for to_code, rate in row.items()
+}
+
+# Parsed PDF text keyed by URL, revalidated with ETag/Last-Modified once stale
+_PDF_CACHE_SIZE = 128
+_PDF_CACHE_TTL = 15 * 60  # seconds
+_pdf_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_pdf_cache_lock = threading.Lock()
+
+# Shared HTTP session so repeated downloads from a host reuse connections
+_PDF_TIMEOUT = 30  # seconds
+_PDF_CHUNK_SIZE = 64 * 1024
+_PDF_SPOOL_SIZE = 16 * 1024 * 1024  # larger downloads are spooled to disk
+_session = None
+_session_lock = threading.Lock()
 
 
 def get_current_temperature(location: str, unit: str = "celsius") -> str:
@@ -40,30 +157,29 @@ def get_current_temperature(location: str, unit: str = "celsius") -> str:
         return f"Unable to get temperature for {location}: {str(e)}"
 
 
+def _resolve_timezone(name: str) -> Optional[tzinfo]:
+    """Resolve a timezone abbreviation or IANA name, or return None if unknown"""
+    tz = _TIMEZONES.get(name.upper())
+    if tz is not None:
+        return tz
+
+    tz = _zone_cache.get(name)
+    if tz is None:
+        try:
+            tz = ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            return None
+        _zone_cache[name] = tz
+    return tz
+
+
 def get_current_time(timezone: str = "UTC") -> str:
     """Get the current date and time in a specific timezone"""
     try:
-        # For simplicity, we'll use UTC and common timezone offsets
-        from datetime import datetime, timezone, timedelta
-
-        # Map common timezone names to offsets
-        timezone_offsets = {
-            "UTC": 0,
-            "EST": -5, "EDT": -4,
-            "CST": -6, "CDT": -5,
-            "MST": -7, "MDT": -6,
-            "PST": -8, "PDT": -7,
-            "GMT": 0,
-            "CET": 1, "CEST": 2,
-            "JST": 9,
-            "AEST": 10, "AEDT": 11
-        }
-
-        # Get offset or default to UTC
-        offset_hours = timezone_offsets.get(timezone.upper(), 0)
-
-        # Create timezone with offset
-        tz = timezone(timedelta(hours=offset_hours))
+        tz = _resolve_timezone(timezone)
+        if tz is None:
+            return (f"Unable to get time for timezone {timezone}: unknown timezone name. "
+                    f"Use an IANA name such as 'America/New_York' or one of: {', '.join(_TIMEZONES)}")
 
         # Get current time in specified timezone
         now = datetime.now(tz)
@@ -76,71 +192,168 @@ def get_current_time(timezone: str = "UTC") -> str:
 def convert_currency(amount: float, from_currency: str, to_currency: str) -> str:
     """Convert currency from one type to another"""
     try:
-        # Mock exchange rates for demonstration
-        exchange_rates = {
-            "USD": {"EUR": 0.85, "GBP": 0.73, "JPY": 110.0, "CAD": 1.25, "AUD": 1.35},
-            "EUR": {"USD": 1.18, "GBP": 0.86, "JPY": 129.0, "CAD": 1.47, "AUD": 1.59},
-            "GBP": {"USD": 1.37, "EUR": 1.16, "JPY": 150.0, "CAD": 1.71, "AUD": 1.85},
-            "JPY": {"USD": 0.0091, "EUR": 0.0078, "GBP": 0.0067, "CAD": 0.011, "AUD": 0.012},
-            "CAD": {"USD": 0.80, "EUR": 0.68, "GBP": 0.58, "JPY": 88.0, "AUD": 1.08},
-            "AUD": {"USD": 0.74, "EUR": 0.63, "GBP": 0.54, "JPY": 81.0, "CAD": 0.93}
-        }
-
         from_currency = from_currency.upper()
         to_currency = to_currency.upper()
 
         if from_currency == to_currency:
             return f"{amount:.2f} {from_currency} = {amount:.2f} {to_currency}"
 
-        if from_currency in exchange_rates and to_currency in exchange_rates[from_currency]:
-            rate = exchange_rates[from_currency][to_currency]
-            converted_amount = amount * rate
-            return f"{amount:.2f} {from_currency} = {converted_amount:.2f} {to_currency} (rate: {rate:.4f})"
-        else:
+        rate = _RATES.get((from_currency, to_currency))
+        if rate is None:
             return f"Exchange rate not available for {from_currency} to {to_currency}"
+
+        converted_amount = amount * rate
+        return f"{amount:.2f} {from_currency} = {converted_amount:.2f} {to_currency} (rate: {rate:.4f})"
     except Exception as e:
         return f"Unable to convert currency: {str(e)}"
 
 
-def execute_python_code(code: str) -> Dict[str, Any]:
-    """Execute Python code and return structured output"""
+def _is_pure_module(value: Any) -> bool:
+    """Check whether a value is a module belonging to one of the pure modules"""
+    return isinstance(value, ModuleType) and value.__name__.split(".")[0] in _PURE_MODULES
+
+
+def _import_pure(name: str) -> Any:
+    """Import a module from the pure set for static inspection, or return None"""
     try:
-        import re
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def _resolve_module_chain(node: ast.AST, modules: Dict[str, str]) -> Tuple[bool, Any]:
+    """Statically resolve an attribute chain such as json.decoder.JSONDecoder
+
+    Returns (rooted, value): rooted is False when the chain does not start at a
+    module name. value is the resolved object, or _UNSAFE if any step is private
+    or passes through a module outside the pure set.
+    """
+    attrs = []
+    while isinstance(node, ast.Attribute):
+        attrs.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name) or node.id not in modules:
+        return False, None
+
+    value = _import_pure(modules[node.id])
+    for attr in reversed(attrs):
+        if attr.startswith("_"):
+            return True, _UNSAFE
+        value = getattr(value, attr, None)
+        if isinstance(value, ModuleType) and not _is_pure_module(value):
+            return True, _UNSAFE
+    return True, value
+
+
+def _is_cacheable(tree: ast.AST) -> bool:
+    """Check whether code only uses pure modules, so its result can be reused"""
+    # Modules the code can reach, by bound name: those in the base namespace
+    # plus its imports, which must themselves be pure
+    modules = {
+        name: value.__name__
+        for name, value in _BASE_NAMESPACE.items()
+        if isinstance(value, ModuleType)
+    }
+
+    # Collect imports first so chains are checked wherever the import appears
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name.split(".")[0] not in _PURE_MODULES:
+                    return False
+                if alias.asname:
+                    modules[alias.asname] = alias.name
+                else:
+                    modules[alias.name.split(".")[0]] = alias.name.split(".")[0]
+        elif isinstance(node, ast.ImportFrom):
+            if node.level or not node.module or node.module.split(".")[0] not in _PURE_MODULES:
+                return False
+            for alias in node.names:
+                if alias.name == "*" or alias.name.startswith("_") or alias.name in _UNCACHEABLE_NAMES:
+                    return False
+                # The imported name may itself be a module, e.g. from json import codecs
+                value = getattr(_import_pure(node.module), alias.name, None)
+                if value is None:
+                    value = _import_pure(f"{node.module}.{alias.name}")
+                if isinstance(value, ModuleType):
+                    if not _is_pure_module(value):
+                        return False
+                    modules[alias.asname or alias.name] = value.__name__
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            if node.id in _UNCACHEABLE_NAMES:
+                return False
+        elif isinstance(node, ast.Attribute):
+            # Private and dunder attributes can reach arbitrary objects,
+            # e.g. collections._sys or ().__class__.__subclasses__()
+            if node.attr in _UNCACHEABLE_NAMES or node.attr.startswith("_"):
+                return False
+            if _resolve_module_chain(node, modules)[1] is _UNSAFE:
+                return False
+        elif isinstance(node, ast.Subscript):
+            # Indexing into a module attribute is only allowed for plain constants
+            rooted, value = _resolve_module_chain(node.value, modules)
+            if rooted and not isinstance(value, (str, bytes, tuple, int, float)):
+                return False
+    return True
+
+
+def _compile_code(key: str, code: str) -> Tuple[CodeType, bool]:
+    """Compile cleaned code once, returning the code object and whether its result is cacheable"""
+    with _code_cache_lock:
+        entry = _code_cache.get(key)
+        if entry is not None:
+            _code_cache.move_to_end(key)
+            return entry
+
+    tree = ast.parse(code)
+    entry = (compile(tree, '<string>', 'exec'), _is_cacheable(tree))
+
+    with _code_cache_lock:
+        _code_cache[key] = entry
+        while len(_code_cache) > _CODE_CACHE_SIZE:
+            _code_cache.popitem(last=False)
+
+    return entry
+
+
+def _error_response(e: BaseException, include_traceback: bool) -> Dict[str, Any]:
+    """Build the code_interpreter response for an exception raised by user code"""
+    if isinstance(e, SyntaxError):
+        error_msg = f"Syntax Error on line {e.lineno}: {e.msg}\n{e.text}"
+        return {
+            "error": error_msg,
+            "error_type": "SyntaxError",
+            "success": False
+        }
+
+    response = {
+        "error": str(e),
+        "error_type": type(e).__name__,
+        "success": False
+    }
+    if include_traceback:
         import traceback
+        response["traceback"] = "".join(traceback.TracebackException.from_exception(e).format())
+    return response
 
-        # Strip markdown code blocks and other formatting
-        code = re.sub(r'^```(?:python|py)?\s*\n', '', code.strip())
-        code = re.sub(r'\n```\s*$', '', code)
-        code = re.sub(r'^```\s*', '', code)
-        code = re.sub(r'\s*```$', '', code)
 
-        # Also strip any leading/trailing whitespace
-        code = code.strip()
+def _run_code(compiled: CodeType, include_traceback: bool) -> Dict[str, Any]:
+    """Execute compiled code in a fresh namespace, capturing its output and result"""
+    import contextlib
+    import io
 
-        # Convert common mathematical notation to Python syntax
-        # Replace ^ with ** for exponentiation
-        code = re.sub(r'\^', '**', code)
-
-        # Create a full Python namespace with all builtins available
-        # This gives the agent access to the complete Python environment
-        import sys
-        namespace = {
-            '__builtins__': __builtins__,
-            'math': math,
-            'sqrt': math.sqrt,  # Make sqrt directly available
-            'random': random,
-            'datetime': datetime,
-            'sys': sys,
-            're': re,
-            'json': json
-        }
+    try:
+        # Start from a fresh copy of the shared base namespace
+        namespace = _BASE_NAMESPACE.copy()
 
         # Capture both stdout and stderr
         output_buffer = io.StringIO()
         error_buffer = io.StringIO()
 
         with contextlib.redirect_stdout(output_buffer), contextlib.redirect_stderr(error_buffer):
-            exec(code, namespace)
+            exec(compiled, namespace)
 
         # Get output and any error messages
         printed_output = output_buffer.getvalue()
@@ -154,58 +367,279 @@ def execute_python_code(code: str) -> Dict[str, Any]:
                     result = namespace[var_name]
                     break
 
-        response = {
+        return {
             "result": result,
             "output": printed_output if printed_output else None,
             "stderr": error_output if error_output else None,
             "success": True
         }
-
-        return response
-
-    except SyntaxError as e:
-        error_msg = f"Syntax Error on line {e.lineno}: {e.msg}\n{e.text}"
+    except SystemExit as e:
         return {
-            "error": error_msg,
-            "error_type": "SyntaxError",
+            "error": f"Code called exit() with status {e.code}",
+            "error_type": "SystemExit",
             "success": False
         }
     except Exception as e:
-        error_trace = traceback.format_exc()
-        return {
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "traceback": error_trace,
-            "success": False
-        }
+        return _error_response(e, include_traceback)
 
 
-def parse_pdf_content(pdf_url: str) -> str:
-    """Parse and extract text content from a PDF file"""
+def _address_space_size() -> Optional[int]:
+    """Return the current virtual memory size in bytes, if the platform exposes it"""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _apply_resource_limits() -> None:
+    """Limit the CPU time and address space growth of the current process"""
+    try:
+        import resource
+    except ImportError:
+        return  # Not available on Windows; only the wall-clock limit applies
+
+    limits = [(resource.RLIMIT_CPU, _EXEC_CPU_LIMIT, _EXEC_CPU_LIMIT + 1)]
+    # A forked child inherits the parent's address space, so cap the growth beyond it
+    address_space = _address_space_size()
+    if address_space is not None:
+        memory_limit = address_space + _EXEC_MEMORY_LIMIT
+        limits.append((resource.RLIMIT_AS, memory_limit, memory_limit))
+    for limit, soft, hard in limits:
+        try:
+            resource.setrlimit(limit, (soft, hard))
+        except (ValueError, OSError):
+            pass  # The platform does not enforce this limit
+
+
+def _run_code_in_child(conn, code: Any, include_traceback: bool) -> None:
+    """Child process entry point: apply resource limits, run the code, send back the response
+
+    code is a compiled code object for forked children, or the cleaned source
+    string for spawned ones, since code objects cannot be pickled.
+    """
     try:
-        # Download PDF
-        response = requests.get(pdf_url)
-        response.raise_for_status()
+        _apply_resource_limits()
+        if isinstance(code, str):
+            code = compile(code, '<string>', 'exec')
+        response = _run_code(code, include_traceback)
+        try:
+            conn.send(response)
+        except Exception:
+            # Results that cannot be pickled are returned as their repr
+            response["result"] = repr(response["result"])
+            conn.send(response)
+        conn.close()
+    finally:
+        # Exit immediately: the normal multiprocessing shutdown joins non-daemon
+        # threads started by the code and flushes stdio, either of which can block
+        os._exit(0)
+
+
+def _reap_child(process) -> None:
+    """Wait briefly for a child to exit, killing it if it does not"""
+    process.join(_EXEC_EXIT_GRACE)
+    if process.is_alive():
+        process.kill()
+        process.join()
+
+
+def _run_code_limited(code: str, compiled: CodeType, include_traceback: bool) -> Dict[str, Any]:
+    """Execute code in a child process bounded in CPU time, memory and wall time"""
+    import multiprocessing
+    import signal
+
+    context = multiprocessing.get_context(_EXEC_START_METHOD)
+    parent_conn, child_conn = context.Pipe(duplex=False)
+    payload = compiled if _EXEC_START_METHOD == "fork" else code
+    process = context.Process(target=_run_code_in_child, args=(child_conn, payload, include_traceback))
+    process.start()
+    child_conn.close()
 
-        # Create PDF reader object
-        pdf_reader = PyPDF2.PdfReader(BytesIO(response.content))
+    try:
+        if not parent_conn.poll(_EXEC_TIMEOUT):
+            process.kill()
+            return {
+                "error": f"Code execution timed out after {_EXEC_TIMEOUT} seconds",
+                "error_type": "TimeoutError",
+                "success": False
+            }
+        try:
+            return parent_conn.recv()
+        except EOFError:
+            # The child died without responding, e.g. killed by a resource limit
+            _reap_child(process)
+            cpu_signals = [getattr(signal, name, None) for name in ("SIGXCPU", "SIGKILL")]
+            if process.exitcode in [-sig for sig in cpu_signals if sig is not None]:
+                error_msg = f"Code execution exceeded the CPU time limit of {_EXEC_CPU_LIMIT} seconds"
+            else:
+                error_msg = f"Code execution terminated unexpectedly (exit code {process.exitcode})"
+            return {
+                "error": error_msg,
+                "error_type": "ResourceLimitError",
+                "success": False
+            }
+    finally:
+        parent_conn.close()
+        _reap_child(process)
+
+
+def execute_python_code(code: str, include_traceback: bool = False) -> Dict[str, Any]:
+    """Execute Python code and return structured output
+
+    The formatted traceback of a runtime error is only included when
+    include_traceback is True. The code runs in a child process with CPU
+    time, memory and wall-clock limits so runaway code cannot stall the server.
+    """
+    try:
+        # Strip markdown code blocks and other formatting
+        code = _CODE_FENCE.sub('', code.strip())
 
-        # Extract text from all pages
-        text_content = []
-        for page_num in range(len(pdf_reader.pages)):
-            page = pdf_reader.pages[page_num]
-            text_content.append(f"Page {page_num + 1}:\n{page.extract_text()}")
+        # Also strip any leading/trailing whitespace
+        code = code.strip()
 
-        return "\n\n".join(text_content)
+        # Convert common mathematical notation to Python syntax
+        # Replace ^ with ** for exponentiation
+        code = code.replace('^', '**')
+
+        # Reuse the result of an identical earlier run
+        key = hashlib.blake2b(code.encode(), digest_size=16).hexdigest()
+        with _exec_cache_lock:
+            cached = _exec_cache.get(key)
+            if cached is not None:
+                _exec_cache.move_to_end(key)
+                return copy.deepcopy(cached)
+
+        compiled, cacheable = _compile_code(key, code)
+    except Exception as e:
+        return _error_response(e, include_traceback)
+
+    response = _run_code_limited(code, compiled, include_traceback)
+
+    if cacheable and response["success"]:
+        with _exec_cache_lock:
+            _exec_cache[key] = copy.deepcopy(response)
+            while len(_exec_cache) > _EXEC_CACHE_SIZE:
+                _exec_cache.popitem(last=False)
+
+    return response
+
+
+def _extract_pdf_text(pdf_file: BinaryIO) -> str:
+    """Extract the text of every page of a PDF document read from a binary file"""
+    try:
+        import pymupdf  # C-backed extractor, much faster than PyPDF2
+    except ImportError:
+        pymupdf = None
+
+    if pymupdf is not None:
+        # PyMuPDF only opens in-memory buffers or named files
+        doc = pymupdf.open(stream=pdf_file.read(), filetype="pdf")
+        try:
+            return "\n\n".join(
+                f"Page {page_num}:\n{page.get_text()}"
+                for page_num, page in enumerate(doc, 1)
+            )
+        finally:
+            doc.close()
+
+    import PyPDF2
+
+    # Create PDF reader object
+    pdf_reader = PyPDF2.PdfReader(pdf_file)
+
+    # Extract text from all pages. Pages are extracted sequentially because
+    # PdfReader reads every page through one shared, non-thread-safe stream.
+    return "\n\n".join(
+        f"Page {page_num}:\n{page.extract_text()}"
+        for page_num, page in enumerate(pdf_reader.pages, 1)
+    )
+
+
+def _get_session():
+    """Return the shared requests session, creating it on first use"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                # Heavy dependencies are only imported when a PDF is actually fetched
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+def parse_pdf_content(pdf_url: str) -> str:
+    """Parse and extract text content from a PDF file"""
+    try:
+        with _pdf_cache_lock:
+            cached = _pdf_cache.get(pdf_url)
+            if cached is not None:
+                _pdf_cache.move_to_end(pdf_url)
+
+        # Serve fresh entries without touching the network
+        if cached is not None and time.monotonic() - cached["fetched_at"] < _PDF_CACHE_TTL:
+            return cached["text"]
+
+        # Revalidate stale entries with a conditional GET
+        headers = {}
+        if cached is not None:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        # Download PDF, streaming the body into a spooled temporary file
+        with _get_session().get(pdf_url, headers=headers, timeout=_PDF_TIMEOUT,
+                                stream=True) as response:
+            if cached is not None and response.status_code == 304:
+                cached["fetched_at"] = time.monotonic()
+                return cached["text"]
+
+            response.raise_for_status()
+            with tempfile.SpooledTemporaryFile(max_size=_PDF_SPOOL_SIZE) as pdf_file:
+                for chunk in response.iter_content(chunk_size=_PDF_CHUNK_SIZE):
+                    pdf_file.write(chunk)
+                pdf_file.seek(0)
+                text = _extract_pdf_text(pdf_file)
+
+        with _pdf_cache_lock:
+            _pdf_cache[pdf_url] = {
+                "text": text,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": time.monotonic()
+            }
+            _pdf_cache.move_to_end(pdf_url)
+            while len(_pdf_cache) > _PDF_CACHE_SIZE:
+                _pdf_cache.popitem(last=False)
+
+        return text
     except Exception as e:
         return f"Error parsing PDF: {str(e)}"
 
 
-def get_random_number(min_val: int = 1, max_val: int = 100) -> str:
-    """Generate a random number within a specified range"""
+def get_random_number(min_val: int = 1, max_val: int = 100, count: int = 1) -> str:
+    """Generate one or more random numbers within a specified range"""
     try:
-        number = random.randint(min_val, max_val)
-        return f"Random number between {min_val} and {max_val}: {number}"
+        if min_val > max_val:
+            return f"Error generating random number: min_val ({min_val}) is greater than max_val ({max_val})"
+        if not 1 <= count <= _MAX_RANDOM_COUNT:
+            return f"Error generating random number: count must be between 1 and {_MAX_RANDOM_COUNT}"
+
+        if count == 1:
+            number = _rng.randrange(min_val, max_val + 1)
+            return f"Random number between {min_val} and {max_val}: {number}"
+
+        # randrange stays exact and unbiased for ranges of any size
+        numbers = [_rng.randrange(min_val, max_val + 1) for _ in range(count)]
+        return f"{count} random numbers between {min_val} and {max_val}: {', '.join(map(str, numbers))}"
     except Exception as e:
         return f"Error generating random number: {str(e)}"
 
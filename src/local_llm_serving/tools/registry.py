@@ -1,17 +1,58 @@
 """
 Tool registry for managing available tools
 """
+import importlib
 import json
-from typing import Dict, Any, List
-from .implementations import (
-    get_current_temperature,
-    get_current_time,
-    convert_currency,
-    execute_python_code,
-    parse_pdf_content,
-    get_random_number,
-    cat_file
-)
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Tuple
+
+try:
+    import orjson  # Optional, much faster serialization of tool results
+except ImportError:
+    orjson = None
+
+
+def _implementations():
+    """Import the tool implementations module on first use"""
+    return importlib.import_module(".implementations", __package__)
+
+
+# Upper bound on threads used to run a batch of tool calls
+_MAX_BATCH_WORKERS = 8
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool result to JSON, preferring orjson when installed
+
+    The exact text depends on the encoder: orjson writes compact separators
+    and encodes NaN/inf as null, while json.dumps uses ", "/": " and NaN.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits, which the stdlib encoder accepts
+            pass
+    return json.dumps(obj)
+
+
+# Loaders for the built-in tool functions, resolved on first execution
+_TOOL_LOADERS = {
+    "get_current_temperature": lambda: _implementations().get_current_temperature,
+    "get_current_time": lambda: _implementations().get_current_time,
+    "convert_currency": lambda: _implementations().convert_currency,
+    "execute_python_code": lambda: _implementations().execute_python_code,
+    "parse_pdf_content": lambda: _implementations().parse_pdf_content,
+    "get_random_number": lambda: _implementations().get_random_number,
+    "cat_file": lambda: _implementations().cat_file,
+}
+
+
+def __getattr__(name: str):
+    """Lazily expose the built-in tool functions as module attributes"""
+    if name in _TOOL_LOADERS:
+        return _TOOL_LOADERS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ToolRegistry:
@@ -19,13 +60,16 @@ class ToolRegistry:
 
     def __init__(self):
         self.tools = {}
+        self._dispatch: Dict[str, Callable] = {}
+        self._schema_cache = None
         self._register_default_tools()
 
     def _register_default_tools(self):
         """Register default tools"""
         self.register_tool(
             name="get_current_temperature",
-            function=get_current_temperature,
+            function=_TOOL_LOADERS["get_current_temperature"],
+            lazy=True,
             description="Get the current temperature for a specific location",
             parameters={
                 "type": "object",
@@ -46,14 +90,15 @@ class ToolRegistry:
 
         self.register_tool(
             name="get_current_time",
-            function=get_current_time,
+            function=_TOOL_LOADERS["get_current_time"],
+            lazy=True,
             description="Get the current date and time in a specific timezone",
             parameters={
                 "type": "object",
                 "properties": {
                     "timezone": {
                         "type": "string",
-                        "description": "Timezone name (e.g., 'America/New_York', 'Europe/London', 'Asia/Tokyo'). Use standard IANA timezone names.",
+                        "description": "Timezone name (e.g., 'America/New_York', 'Europe/London', 'Asia/Tokyo'). Use standard IANA timezone names; common abbreviations such as 'UTC', 'EST' or 'JST' also work.",
                         "default": "UTC"
                     }
                 },
@@ -63,7 +108,8 @@ class ToolRegistry:
 
         self.register_tool(
             name="convert_currency",
-            function=convert_currency,
+            function=_TOOL_LOADERS["convert_currency"],
+            lazy=True,
             description="Convert an amount from one currency to another. You MUST use this tool to convert currencies in order to get the latest exchange rate.",
             parameters={
                 "type": "object",
@@ -87,7 +133,8 @@ class ToolRegistry:
 
         self.register_tool(
             name="code_interpreter",
-            function=execute_python_code,
+            function=_TOOL_LOADERS["execute_python_code"],
+            lazy=True,
             description="Execute Python code for calculations and data processing. You MUST use this tool to perform any complex calculations or data processing.",
             parameters={
                 "type": "object",
@@ -95,6 +142,11 @@ class ToolRegistry:
                     "code": {
                         "type": "string",
                         "description": "Python code to execute"
+                    },
+                    "include_traceback": {
+                        "type": "boolean",
+                        "description": "Include the full traceback if the code raises an error (default: false)",
+                        "default": False
                     }
                 },
                 "required": ["code"]
@@ -103,7 +155,8 @@ class ToolRegistry:
 
         self.register_tool(
             name="parse_pdf",
-            function=parse_pdf_content,
+            function=_TOOL_LOADERS["parse_pdf_content"],
+            lazy=True,
             description="Parse and extract text content from a PDF file",
             parameters={
                 "type": "object",
@@ -119,8 +172,9 @@ class ToolRegistry:
 
         self.register_tool(
             name="get_random_number",
-            function=get_random_number,
-            description="Generate a random number within a specified range",
+            function=_TOOL_LOADERS["get_random_number"],
+            lazy=True,
+            description="Generate one or more random numbers within a specified range",
             parameters={
                 "type": "object",
                 "properties": {
@@ -133,6 +187,11 @@ class ToolRegistry:
                         "type": "integer",
                         "description": "Maximum value (default: 100)",
                         "default": 100
+                    },
+                    "count": {
+                        "type": "integer",
+                        "description": "How many numbers to generate, up to 1000 (default: 1)",
+                        "default": 1
                     }
                 },
                 "required": []
@@ -141,7 +200,8 @@ class ToolRegistry:
 
         self.register_tool(
             name="cat_file",
-            function=cat_file,
+            function=_TOOL_LOADERS["cat_file"],
+            lazy=True,
             description="Read and display the contents of a file using the cat shell command",
             parameters={
                 "type": "object",
@@ -155,39 +215,74 @@ class ToolRegistry:
             }
         )
 
-    def register_tool(self, name: str, function: callable, description: str, parameters: Dict):
-        """Register a new tool"""
+    def register_tool(self, name: str, function: callable, description: str, parameters: Dict,
+                      lazy: bool = False):
+        """Register a new tool
+
+        If lazy is True, function is a zero-argument loader that returns the
+        real tool function; it is called once, on the first execution.
+        """
         self.tools[name] = {
             "function": function,
             "description": description,
-            "parameters": parameters
+            "parameters": parameters,
+            "lazy": lazy
         }
+        self._dispatch[name] = self._lazy_dispatch(name, function) if lazy else function
+        self._schema_cache = None
+
+    def _lazy_dispatch(self, name: str, loader: Callable) -> Callable:
+        """Wrap a loader so the first call resolves and installs the real function"""
+        def resolve(**arguments):
+            function = loader()
+            self.tools[name]["function"] = function
+            self.tools[name]["lazy"] = False
+            self._dispatch[name] = function
+            return function(**arguments)
+        return resolve
 
     def get_tool_schemas(self) -> List[Dict]:
-        """Get OpenAI-compatible tool schemas"""
-        schemas = []
-        for name, tool in self.tools.items():
-            schemas.append({
-                "type": "function",
-                "function": {
-                    "name": name,
-                    "description": tool["description"],
-                    "parameters": tool["parameters"]
+        """Get OpenAI-compatible tool schemas
+
+        The list is built once and shared until the next register_tool call,
+        so callers must not mutate it.
+        """
+        if self._schema_cache is None:
+            self._schema_cache = [
+                {
+                    "type": "function",
+                    "function": {
+                        "name": name,
+                        "description": tool["description"],
+                        "parameters": tool["parameters"]
+                    }
                 }
-            })
-        return schemas
+                for name, tool in self.tools.items()
+            ]
+        return self._schema_cache
 
     def execute_tool(self, name: str, arguments: Dict[str, Any]) -> str:
         """Execute a tool by name with given arguments"""
-        if name not in self.tools:
+        function = self._dispatch.get(name)
+        if function is None:
             return json.dumps({"error": f"Tool '{name}' not found"})
 
         try:
-            result = self.tools[name]["function"](**arguments)
-            return json.dumps(result) if isinstance(result, (dict, list)) else str(result)
+            result = function(**arguments)
+            if isinstance(result, str):
+                return result
+            return _dumps(result) if isinstance(result, (dict, list)) else str(result)
         except Exception as e:
             return json.dumps({"error": str(e)})
 
+    def execute_tools_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Execute independent tool calls concurrently, returning results in call order"""
+        if len(calls) <= 1:
+            return [self.execute_tool(name, arguments) for name, arguments in calls]
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_BATCH_WORKERS, len(calls))) as executor:
+            return list(executor.map(lambda call: self.execute_tool(*call), calls))
+
 
 def format_tool_response(tool_name: str, tool_result: str) -> Dict:
     """Format tool response for the chat model"""
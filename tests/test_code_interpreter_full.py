@@ -129,6 +129,179 @@ def test_full_environment_access():
         else:
             print(f"  ✗ Failed: {result_dict.get('error')}")
 
+def test_markdown_fence_stripping():
+    """Test that markdown fences and ^ exponentiation are normalized"""
+    from local_llm_serving.tools.implementations import execute_python_code
+
+    for code in [
+        "```python\nresult = 2^10\n```",
+        "```py\nresult = 2^10\n```",
+        "```\nresult = 2^10\n```",
+        "```result = 2^10```",
+        "result = 2^10",
+    ]:
+        response = execute_python_code(code)
+        assert response["success"], response
+        assert response["result"] == 1024
+
+def test_result_cache():
+    """Test that deterministic code is cached and random code is not"""
+    from local_llm_serving.tools import implementations
+
+    implementations._exec_cache.clear()
+
+    first = implementations.execute_python_code("print(6 * 7)\nresult = 6 * 7")
+    second = implementations.execute_python_code("print(6 * 7)\nresult = 6 * 7")
+    assert first == second == {"result": 42, "output": "42\n", "stderr": None, "success": True}
+    assert len(implementations._exec_cache) == 1
+
+    implementations.execute_python_code("result = random.randint(1, 6)")
+    implementations.execute_python_code("import time\nresult = time.time()")
+    implementations.execute_python_code("result = 1 / 0")
+    assert len(implementations._exec_cache) == 1
+
+def test_side_effecting_code_reexecuted(tmp_path):
+    """Test that code doing I/O through unlisted modules runs on every call"""
+    from local_llm_serving.tools.implementations import execute_python_code
+
+    counter = tmp_path / "counter"
+    code = (
+        "import pathlib\n"
+        f"p = pathlib.Path({str(counter)!r})\n"
+        "n = int(p.read_text()) if p.exists() else 0\n"
+        "p.write_text(str(n + 1))\n"
+        "result = n"
+    )
+    assert [execute_python_code(code)["result"] for _ in range(3)] == [0, 1, 2]
+    assert counter.read_text() == "3"
+
+def test_cacheability_allowlist():
+    """Test that only code limited to pure modules is considered cacheable"""
+    import ast
+    from local_llm_serving.tools.implementations import _is_cacheable
+
+    cacheable = [
+        "result = 2 + 2",
+        "import statistics as st\nresult = st.mean([1, 2])",
+        "from collections import Counter\nresult = Counter('aab')",
+        "result = math.sqrt(2) + len(json.dumps([1]))",
+        "import collections.abc as abc\nresult = isinstance({}, abc.Mapping)",
+        "import json\nresult = json.decoder.JSONDecoder().decode('[1]')",
+        "import string\nresult = string.ascii_letters[0]",
+    ]
+    uncacheable = [
+        "import pathlib\nresult = pathlib.Path('.').exists()",
+        "from numpy import random",
+        "from math import *",
+        "result = np.random.rand()",
+        "result = sys.version",
+        "result = random.random()",
+        "result = ().__class__.__base__.__subclasses__()",
+        "import collections\ncollections._sys.modules['os'].system('echo x >> f')\nresult = 1",
+        "result = re.copyreg.dispatch_table",
+        "x = json.codecs\nresult = x.lookup('utf-8')",
+        "from json import codecs\nresult = codecs.lookup('utf-8')",
+        "import string\nresult = string._string",
+        "import collections as c\nresult = c.abc.__name__",
+    ]
+    for code in cacheable:
+        assert _is_cacheable(ast.parse(code)), code
+    for code in uncacheable:
+        assert not _is_cacheable(ast.parse(code)), code
+
+def test_cached_result_isolated_from_callers():
+    """Test that mutating a returned result does not change the cache"""
+    from local_llm_serving.tools import implementations
+
+    implementations._exec_cache.clear()
+
+    first = implementations.execute_python_code("result = [1, 2]")
+    first["result"].append(99)
+    second = implementations.execute_python_code("result = [1, 2]")
+    second["result"].append(100)
+
+    assert implementations.execute_python_code("result = [1, 2]")["result"] == [1, 2]
+
+def test_compiled_code_reused():
+    """Test that uncacheable code is compiled once and still re-executed"""
+    from local_llm_serving.tools import implementations
+
+    implementations._code_cache.clear()
+
+    code = "result = random.randint(1, 6)"
+    implementations.execute_python_code(code)
+    compiled = next(iter(implementations._code_cache.values()))
+    response = implementations.execute_python_code(code)
+
+    assert response["success"] and 1 <= response["result"] <= 6
+    assert len(implementations._code_cache) == 1
+    assert next(iter(implementations._code_cache.values())) is compiled
+
+def test_traceback_on_request():
+    """Test that tracebacks are only formatted when requested"""
+    from local_llm_serving.tools.implementations import execute_python_code
+
+    response = execute_python_code("result = 1 / 0")
+    assert response["error_type"] == "ZeroDivisionError"
+    assert "traceback" not in response
+
+    response = execute_python_code("result = 1 / 0", include_traceback=True)
+    assert response["traceback"].startswith("Traceback (most recent call last):")
+    assert "ZeroDivisionError" in response["traceback"]
+
+def test_runaway_code_is_stopped(monkeypatch):
+    """Test that code exceeding the wall-clock limit is terminated"""
+    import pytest
+    from local_llm_serving.tools import implementations
+
+    monkeypatch.setattr(implementations, "_EXEC_TIMEOUT", 1)
+    response = implementations.execute_python_code("while True:\n    pass")
+    assert response == {
+        "error": "Code execution timed out after 1 seconds",
+        "error_type": "TimeoutError",
+        "success": False
+    }
+
+def test_lingering_thread_does_not_block(monkeypatch):
+    """Test that a non-daemon thread left running by the code cannot outlive the limit"""
+    import time
+    import pytest
+    from local_llm_serving.tools import implementations
+
+    monkeypatch.setattr(implementations, "_EXEC_TIMEOUT", 2)
+    code = "import threading\nthreading.Thread(target=__import__('time').sleep, args=(20,)).start()\nresult = 1"
+
+    start = time.monotonic()
+    response = implementations.execute_python_code(code)
+    elapsed = time.monotonic() - start
+
+    assert response["success"] and response["result"] == 1
+    assert elapsed < implementations._EXEC_TIMEOUT + implementations._EXEC_EXIT_GRACE
+
+def test_spawned_child_enforces_timeout(monkeypatch):
+    """Test the spawn start method used on macOS and Windows"""
+    from local_llm_serving.tools import implementations
+
+    monkeypatch.setattr(implementations, "_EXEC_START_METHOD", "spawn")
+    monkeypatch.setattr(implementations, "_EXEC_TIMEOUT", 5)
+
+    response = implementations.execute_python_code("print('hi')\nresult = sqrt(16)")
+    assert response == {"result": 4.0, "output": "hi\n", "stderr": None, "success": True}
+
+    response = implementations.execute_python_code("while True:\n    pass")
+    assert response["error_type"] == "TimeoutError"
+
+def test_exit_reported_as_system_exit():
+    """Test that exit() in user code is reported as such, not as a resource limit"""
+    from local_llm_serving.tools.implementations import execute_python_code
+
+    response = execute_python_code("import sys\nsys.exit(3)")
+    assert response == {
+        "error": "Code called exit() with status 3",
+        "error_type": "SystemExit",
+        "success": False
+    }
+
 def test_agent_error_propagation():
     """Test that errors are properly formatted for the agent"""
     print("\n" + "=" * 60)
@@ -0,0 +1,31 @@
+"""
+Test cases for the configuration module
+"""
+import dataclasses
+import pytest
+from local_llm_serving.config import CONFIG, Config
+
+
+def test_config_is_frozen():
+    """Test that settings cannot be changed after import"""
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        CONFIG.model_name = "other"
+
+
+def test_config_reads_environment(monkeypatch):
+    """Test that settings come from environment variables"""
+    monkeypatch.setenv("OLLAMA_HOST", "example.local")
+    monkeypatch.setenv("OLLAMA_PORT", "8080")
+    monkeypatch.delenv("MODEL_PATH", raising=False)
+
+    config = Config()
+    assert config.ollama_host == "example.local"
+    assert config.ollama_port == 8080
+    assert config.model_path is None
+
+
+def test_config_rejects_malformed_port(monkeypatch):
+    """Test that a non-integer port names the offending variable"""
+    monkeypatch.setenv("OLLAMA_PORT", "eleven")
+    with pytest.raises(ValueError, match="OLLAMA_PORT"):
+        Config()
@@ -0,0 +1,123 @@
+"""
+Test cases for the ToolRegistry
+"""
+import json
+from local_llm_serving.tools import registry as registry_module
+from local_llm_serving.tools.registry import ToolRegistry
+
+
+class FakeOrjson:
+    """Stand-in for the optional orjson module"""
+
+    OPT_NON_STR_KEYS = 1
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = []
+
+    def dumps(self, obj, option=None):
+        self.calls.append(option)
+        if self.fail:
+            raise TypeError("Integer exceeds 64-bit range")
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+class TestToolRegistry:
+    """Test tool registration and execution"""
+
+    def test_default_tools_resolved_on_first_execution(self):
+        """Test that built-in tools are loaded lazily and then cached"""
+        registry = ToolRegistry()
+        assert registry.tools["convert_currency"]["lazy"] is True
+
+        result = registry.execute_tool("convert_currency", {
+            "amount": 10, "from_currency": "USD", "to_currency": "EUR"
+        })
+        assert result == "10.00 USD = 8.50 EUR (rate: 0.8500)"
+        assert registry.tools["convert_currency"]["lazy"] is False
+        assert registry.tools["convert_currency"]["function"].__name__ == "convert_currency"
+
+    def test_custom_tool(self):
+        """Test registering and executing a custom tool"""
+        registry = ToolRegistry()
+        registry.register_tool(
+            name="echo",
+            function=lambda text: {"echo": text},
+            description="Echo the input",
+            parameters={"type": "object", "properties": {}, "required": []}
+        )
+        assert json.loads(registry.execute_tool("echo", {"text": "hi"})) == {"echo": "hi"}
+
+    def test_schemas_cached_until_register(self):
+        """Test that tool schemas are reused and rebuilt after registration"""
+        registry = ToolRegistry()
+        schemas = registry.get_tool_schemas()
+        assert registry.get_tool_schemas() is schemas
+
+        registry.register_tool(
+            name="noop",
+            function=lambda: "ok",
+            description="Do nothing",
+            parameters={"type": "object", "properties": {}, "required": []}
+        )
+        updated = registry.get_tool_schemas()
+        assert updated is not schemas
+        assert updated[-1]["function"]["name"] == "noop"
+        assert len(updated) == len(schemas) + 1
+
+    def test_batch_preserves_order(self):
+        """Test that batched tool calls return results in call order"""
+        registry = ToolRegistry()
+        results = registry.execute_tools_batch([
+            ("convert_currency", {"amount": 1, "from_currency": "USD", "to_currency": "EUR"}),
+            ("code_interpreter", {"code": "print('a')\nresult = 1"}),
+            ("missing", {}),
+            ("code_interpreter", {"code": "print('b')\nresult = 2"}),
+        ])
+        assert results[0] == "1.00 USD = 0.85 EUR (rate: 0.8500)"
+        assert json.loads(results[1])["output"] == "a\n"
+        assert json.loads(results[2]) == {"error": "Tool 'missing' not found"}
+        assert json.loads(results[3])["output"] == "b\n"
+
+    def test_unknown_tool(self):
+        """Test executing a tool that does not exist"""
+        registry = ToolRegistry()
+        result = json.loads(registry.execute_tool("missing", {}))
+        assert result == {"error": "Tool 'missing' not found"}
+
+
+class TestDumps:
+    """Test serialization of tool results"""
+
+    def test_uses_orjson_when_installed(self, monkeypatch):
+        """Test that orjson is used, with non-string keys enabled"""
+        fake = FakeOrjson()
+        monkeypatch.setattr(registry_module, "orjson", fake)
+        assert registry_module._dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+        assert fake.calls == [FakeOrjson.OPT_NON_STR_KEYS]
+
+    def test_falls_back_on_orjson_type_error(self, monkeypatch):
+        """Test that values orjson rejects are serialized by the stdlib"""
+        fake = FakeOrjson(fail=True)
+        monkeypatch.setattr(registry_module, "orjson", fake)
+        assert registry_module._dumps([2 ** 70]) == "[1180591620717411303424]"
+        assert len(fake.calls) == 1
+
+    def test_stdlib_without_orjson(self, monkeypatch):
+        """Test that the stdlib encoder is used when orjson is missing"""
+        monkeypatch.setattr(registry_module, "orjson", None)
+        assert registry_module._dumps({"a": [1, 2]}) == '{"a": [1, 2]}'
+
+    def test_execute_tool_serializes_through_orjson(self, monkeypatch):
+        """Test that dict results from tools go through _dumps"""
+        fake = FakeOrjson()
+        monkeypatch.setattr(registry_module, "orjson", fake)
+        registry = ToolRegistry()
+        registry.register_tool(
+            name="pair",
+            function=lambda: {"x": 1},
+            description="Return a dict",
+            parameters={"type": "object", "properties": {}, "required": []}
+        )
+        assert registry.execute_tool("pair", {}) == '{"x":1}'
+        assert len(fake.calls) == 1
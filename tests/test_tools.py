@@ -0,0 +1,178 @@
+"""
+Test cases for the built-in tool implementations
+"""
+import pytest
+from local_llm_serving.tools import implementations
+from local_llm_serving.tools.implementations import (
+    convert_currency,
+    get_current_time,
+    get_random_number,
+    parse_pdf_content
+)
+
+
+class TestConvertCurrency:
+    """Test the convert_currency tool implementation"""
+
+    def test_known_pair(self):
+        """Test converting between supported currencies"""
+        assert convert_currency(100, "usd", "jpy") == "100.00 USD = 11000.00 JPY (rate: 110.0000)"
+
+    def test_same_currency(self):
+        """Test converting a currency to itself"""
+        assert convert_currency(5, "EUR", "eur") == "5.00 EUR = 5.00 EUR"
+
+    def test_unknown_pair(self):
+        """Test converting to an unsupported currency"""
+        assert convert_currency(1, "USD", "XYZ") == "Exchange rate not available for USD to XYZ"
+
+
+class TestGetCurrentTime:
+    """Test the get_current_time tool implementation"""
+
+    def test_known_timezone(self):
+        """Test that a known abbreviation uses its offset and name"""
+        result = get_current_time("jst")
+        assert result.startswith("Current time in jst: ")
+        assert result.endswith(" JST")
+
+    def test_iana_timezone(self):
+        """Test that IANA names are resolved through zoneinfo"""
+        result = get_current_time("Asia/Tokyo")
+        assert result.startswith("Current time in Asia/Tokyo: ")
+        assert result.endswith(" JST")
+
+    def test_unknown_timezone_reported(self):
+        """Test that unknown timezone names return an error instead of UTC"""
+        result = get_current_time("Mars/Olympus")
+        assert result.startswith("Unable to get time for timezone Mars/Olympus: unknown timezone name")
+
+
+class TestGetRandomNumber:
+    """Test the get_random_number tool implementation"""
+
+    def test_within_bounds(self):
+        """Test that generated numbers stay within the inclusive range"""
+        for _ in range(50):
+            number = int(get_random_number(3, 5).rsplit(": ", 1)[1])
+            assert 3 <= number <= 5
+
+    def test_batch(self):
+        """Test generating several numbers in one call"""
+        prefix, numbers = get_random_number(1, 6, count=20).split(": ")
+        assert prefix == "20 random numbers between 1 and 6"
+        values = [int(n) for n in numbers.split(", ")]
+        assert len(values) == 20
+        assert all(1 <= n <= 6 for n in values)
+
+    def test_batch_large_range(self):
+        """Test that batches work and stay unbiased beyond float precision"""
+        prefix, numbers = get_random_number(0, 2 ** 70, count=50).split(": ")
+        assert prefix == f"50 random numbers between 0 and {2 ** 70}"
+        values = [int(n) for n in numbers.split(", ")]
+        assert all(0 <= n <= 2 ** 70 for n in values)
+        # A float-based draw only yields multiples of a large power of two here
+        assert any(n % 512 for n in values)
+
+    def test_invalid_count(self):
+        """Test that counts outside the supported range are rejected"""
+        assert get_random_number(count=0).startswith("Error generating random number")
+        assert get_random_number(count=1001).startswith("Error generating random number")
+
+    def test_invalid_range(self):
+        """Test that an inverted range is reported as an error"""
+        assert get_random_number(10, 1).startswith("Error generating random number")
+
+    def test_invalid_argument_types(self):
+        """Test that wrongly typed arguments are reported, not raised"""
+        assert get_random_number("1", 10).startswith("Error generating random number")
+        assert get_random_number(1, 10, count="5").startswith("Error generating random number")
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, status_code=200, content=b"%PDF", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class TestParsePdfCache:
+    """Test caching of parsed PDF text"""
+
+    @pytest.fixture
+    def fetches(self, monkeypatch):
+        """Record outgoing requests and stub out PDF parsing"""
+        calls = []
+        responses = []
+
+        def fake_get(url, headers=None, **kwargs):
+            calls.append(headers or {})
+            return responses.pop(0)
+
+        session = type("FakeSession", (), {"get": staticmethod(fake_get)})()
+        monkeypatch.setattr(implementations, "_get_session", lambda: session)
+        monkeypatch.setattr(implementations, "_extract_pdf_text", lambda pdf_file: pdf_file.read().decode())
+        monkeypatch.setattr(implementations, "_pdf_cache", implementations.OrderedDict())
+        return calls, responses
+
+    def test_fresh_entry_skips_network(self, fetches):
+        """Test that a repeated URL is served from the cache"""
+        calls, responses = fetches
+        responses.append(FakeResponse(content=b"hello"))
+
+        assert parse_pdf_content("https://example.com/a.pdf") == "hello"
+        assert parse_pdf_content("https://example.com/a.pdf") == "hello"
+        assert len(calls) == 1
+
+    def test_stale_entry_revalidated(self, fetches, monkeypatch):
+        """Test that stale entries send validators and reuse text on 304"""
+        calls, responses = fetches
+        monkeypatch.setattr(implementations, "_PDF_CACHE_TTL", 0)
+        responses.append(FakeResponse(content=b"hello", headers={"ETag": '"v1"'}))
+        responses.append(FakeResponse(status_code=304))
+
+        assert parse_pdf_content("https://example.com/a.pdf") == "hello"
+        assert parse_pdf_content("https://example.com/a.pdf") == "hello"
+        assert calls[1] == {"If-None-Match": '"v1"'}
+
+    def test_errors_not_cached(self, fetches):
+        """Test that failed downloads are retried"""
+        calls, responses = fetches
+        responses.append(FakeResponse(status_code=404))
+        responses.append(FakeResponse(content=b"hello"))
+
+        assert parse_pdf_content("https://example.com/a.pdf").startswith("Error parsing PDF")
+        assert parse_pdf_content("https://example.com/a.pdf") == "hello"
+
+
+def test_extract_pdf_text_numbers_pages():
+    """Test that every page is extracted with a page header"""
+    from io import BytesIO
+    import PyPDF2
+
+    writer = PyPDF2.PdfWriter()
+    writer.add_blank_page(100, 100)
+    writer.add_blank_page(100, 100)
+    buffer = BytesIO()
+    writer.write(buffer)
+
+    buffer.seek(0)
+    text = implementations._extract_pdf_text(buffer)
+    assert text.startswith("Page 1:\n")
+    assert "\n\nPage 2:\n" in text